@@ -52,15 +52,20 @@ class Command:
     def main(self) -> int:
         start = time.perf_counter()
         count = 0
-        print('[')
+
+        # Write compact JSON straight to the binary buffer behind stdout
+        out = sys.stdout.buffer
+        out.write(b'[\n')
         for line in self.readlines():
             try:
                 data = parser.parse(line)
                 count += 1
-                print(data.to_json(), end=',\n')
+                out.write(data.to_json_bytes())
+                out.write(b',\n')
             except parser.UnknownSentence as e:
                 logger.debug(e)
-        print(']')
+        out.write(b']\n')
+        out.flush()
 
         elapsed = (time.perf_counter() - start) * 1000
         logger.info(f"Parsed {count:,} sentences in {elapsed:.1f}ms")
@@ -1,6 +1,9 @@
 """
 Handle NMEA checksums.
 """
+from functools import reduce
+import operator
+from typing import Iterable, List
 
 
 def add(sentence: str) -> str:
@@ -15,7 +18,7 @@ def add(sentence: str) -> str:
     if '*' in sentence:
         raise ValueError(f"Sentence already has a checksum: {sentence!r}")
     checksum = calculate(sentence)
-    return f"{sentence}*{checksum:X}"
+    return f"{sentence}*{checksum:02X}"
 
 
 def calculate(sentence: str) -> int:
@@ -23,18 +26,13 @@ def calculate(sentence: str) -> int:
     Calculate single-byte checksum of the given NMEA message.
     """
     # Drop sentence delimiters and any existing checksum
-    inner, _, _ = sentence.partition('*')
-    inner = inner[1:]
+    data = sentence.encode('ascii', errors='strict')
+    star = data.find(b'*')
+    end = star if star != -1 else len(data)
+    return _calculate_bytes(data, 1, end)
 
-    # Calculate checksum
-    inner_bytes = inner.encode('ascii', errors='strict')
-    checksum = 0
-    for b in inner_bytes:
-        checksum ^= b
-    return checksum
 
-
-def verify(sentence: str) -> bool:
+def verify(sentence: str) -> int:
     """
     Raise exception if checksum of given message is invalid.
 
@@ -47,19 +45,52 @@ def verify(sentence: str) -> bool:
             If no checksum found, of if checksum verification failed.
 
     Returns:
-        True if no exception is raised.
+        Index of the '*' that starts the checksum, counted from the start of
+        the sentence with surrounding whitespace removed. Callers can use it
+        to slice off the checksum without searching for it again. This is
+        zero if there is nothing before the '*', eg. '*00', so don't test
+        the return value for truth.
     """
     sentence = sentence.strip()
-    sentence, _, expected = sentence.partition('*')
-    if not expected:
-        raise ValueError(f"Given sentence has no checksum: {sentence!r}")
-
-    expected = expected.upper()
-    calculated = f"{calculate(sentence):X}"
+    data = sentence.encode('ascii', errors='strict')
+    star = data.find(b'*')
+    if star == -1 or star == len(data) - 1:
+        raise ValueError(f"Given sentence has no checksum: {sentence.rstrip('*')!r}")
+    expected = data[star + 1:]
 
-    if expected != calculated:
+    # Exactly two hex digits, though a leading zero is allowed, eg. '*0F'
+    calculated = _calculate_bytes(data, 1, star)
+    if expected.upper() != b'%02X' % calculated:
         raise ValueError(
             'Checksum in sentence does not match that calculated: '
-            f'0x{expected} != 0x{calculated}')
+            f'0x{expected.decode().upper()} != 0x{calculated:02X}')
+
+    return star
+
+
+def verify_many(sentences: Iterable[str]) -> List[bool]:
+    """
+    Check the checksums of a whole batch of NMEA messages at once.
+
+    Unlike `verify()`, no exception is raised for bad or missing checksums.
 
-    return True
+    Returns:
+        List of booleans, one per given sentence, True where the checksum
+        is present and valid.
+    """
+    results = []
+    for sentence in sentences:
+        try:
+            verify(sentence)
+        except ValueError:
+            results.append(False)
+        else:
+            results.append(True)
+    return results
+
+
+def _calculate_bytes(data: bytes, start: int, end: int) -> int:
+    """
+    XOR together the bytes of `data` from `start` up to, but not including, `end`.
+    """
+    return reduce(operator.xor, data[start:end], 0)
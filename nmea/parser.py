@@ -8,46 +8,108 @@ The rest of the module consists mostly of utility functions.
 """
 
 import datetime
-from typing import Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Type, overload
 
 from . import sentences, checksum
 
 
+# Sentence dataclasses, keyed by the three-letter code that follows the
+# two-letter talker ID (eg. 'GP', 'GL', 'GN') in the address field.
 SENTENCE_TYPES: Dict[str, Type[sentences.Sentence]] = {
-    '$GNGGA': sentences.GGA,
-    '$GPGGA': sentences.GGA,
-    '$GNGSA': sentences.GSA,
-    '$GPGSA': sentences.GSA,
-    '$GLGSV': sentences.GSV,
-    '$GPGSV': sentences.GSV,
-    '$GNRMC': sentences.RMC,
-    '$GPRMC': sentences.RMC,
-    '$GNTXT': sentences.TXT,
+    cls._CODE: cls for cls in (
+        sentences.GGA,
+        sentences.GSA,
+        sentences.GSV,
+        sentences.RMC,
+        sentences.TXT,
+    )
 }
 
 
+# Multipliers to convert altitude into metres, by NMEA units field
+_ALTITUDE_UNITS = {'M': 1.0, 'm': 1.0}
+
+
+# Multipliers to apply the sign for each compass direction
+_LATITUDE_SIGNS = {'N': 1.0, 'S': -1.0, 'n': 1.0, 's': -1.0}
+_LONGITUDE_SIGNS = {'E': 1.0, 'W': -1.0, 'e': 1.0, 'w': -1.0}
+
+
+# Multiplier to scale fractional seconds into microseconds, by missing digits
+_POWERS_OF_TEN = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+# Size of the memoisation caches used by the field parsers. A day has 86,400
+# distinct one-second timestamps, so this comfortably holds a whole day.
+CACHE_SIZE = 2**17
+
+# Dates change only once a day, so need far fewer entries
+DATE_CACHE_SIZE = 4096
+
+
 class UnknownSentence(ValueError):
     pass
 
 
-def parse(sentence: str) -> sentences.Sentence:
+@overload
+def parse(sentence: str, *, strict: Literal[True] = ...) -> sentences.Sentence:
+    ...
+
+
+@overload
+def parse(sentence: str, *, strict: bool) -> Optional[sentences.Sentence]:
+    ...
+
+
+def parse(sentence: str, *, strict: bool = True) -> Optional[sentences.Sentence]:
     """
     Take full NMEA sentence and attempt to parse it using the correct sentence.
-    """
-    checksum.verify(sentence)
-    fields = sentence_split(sentence)
 
+    The sentence type is looked up from its prefix first, so that unknown
+    sentences are rejected before their checksum is verified or their fields
+    are split. Any talker ID is accepted, eg. both '$GPGGA' and '$GLGGA', but
+    not proprietary sentences like '$PGRMC'.
+
+    Args:
+        sentence:
+            Single line of NMEA text.
+        strict:
+            Set to False to return None instead of raising an exception for
+            unknown sentences and invalid lines. Unknown sentences, the most
+            common case in a mixed stream, are then rejected without any
+            exception being created at all.
+
+    Raises:
+        UnknownSentence:
+            If sentence type is not supported, and `strict` is true.
+        ValueError:
+            If checksum or field values are invalid, and `strict` is true.
+
+    Returns:
+        Sentence dataclass, or None if parsing failed.
+    """
     # Find matching sentence dataclass
-    nmea = fields[0]
-    try:
-        sentence_type = SENTENCE_TYPES[nmea]
-    except KeyError as e:
-        message = f"Unknown NMEA sentence: {e}"
-        raise UnknownSentence(message) from None
+    sentence = sentence.strip()
+    address, _, _ = sentence.partition(',')
+    sentence_type = SENTENCE_TYPES.get(sentences.sentence_code(address))
+    if sentence_type is None:
+        if not strict:
+            return None
+        message = f"Unknown NMEA sentence: {address!r}"
+        raise UnknownSentence(message)
 
-    # Build and return dataclass
-    data = sentence_type.from_fields(fields)
-    return data
+    try:
+        # Split fields, using checksum position found in the same stripped string
+        star = checksum.verify(sentence)
+        fields = sentence[:star].split(',')
+
+        # Build and return dataclass
+        return sentence_type.from_fields(fields)
+    except (IndexError, ValueError):
+        if strict:
+            raise
+        return None
 
 
 def parse_altitude(value: str, units: str) -> Optional[float]:
@@ -56,14 +118,14 @@ def parse_altitude(value: str, units: str) -> Optional[float]:
     """
     if not value:
         return None
-    altitude = float(value)
-    units = units.upper()
-    if units == 'M':
-        return altitude
-    else:
-        raise ValueError(f'Unknown altitude units: {units!r}')
+    try:
+        scale = _ALTITUDE_UNITS[units]
+    except KeyError:
+        raise ValueError(f'Unknown altitude units: {units!r}') from None
+    return float(value) * scale
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def parse_date(value: str) -> Optional[datetime.date]:
     """
     Parse NMEA date string into a Python `datetime.date` object.
@@ -99,15 +161,14 @@ def parse_declination(value: str, direction: str) -> Optional[float]:
     if degrees is None:
         return None
 
-    direction = direction.upper()
-    if direction == 'E':
-        return degrees
-    elif direction == 'W':
-        return -degrees
-    else:
-        raise ValueError(f"Declination has bad direction: {direction!r}")
+    try:
+        sign = _LONGITUDE_SIGNS[direction]
+    except KeyError:
+        raise ValueError(f"Declination has bad direction: {direction!r}") from None
+    return sign * degrees
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_degrees(value: str) -> float:
     """
     Parse degrees in NMEA format to decimal degrees.
@@ -125,18 +186,18 @@ def parse_degrees(value: str) -> float:
     """
     if not value:
         raise ValueError(f"Cannot parse degrees, empty value given: {value!r}")
-    first, _, fraction = value.partition('.')
-    value = first[:-2]
-    degrees = float(value) if value else 0
-    minutes = float(f"{first[-2:]}.{fraction}")
-    degrees += minutes / 60
-    return round(degrees, 6)
+
+    # Only digits and a decimal point, as float() also accepts 'nan', '1e3', etc.
+    if not value.replace('.', '', 1).isdigit():
+        raise ValueError(f"Cannot parse degrees, invalid value given: {value!r}")
+
+    # Hundreds hold whole degrees, the remainder is minutes
+    degrees, minutes = divmod(float(value), 100.0)
+    return round(degrees + minutes / 60, 6)
 
 
 def parse_float(value: str) -> Optional[float]:
-    if not value:
-        return None
-    return float(value)
+    return float(value) if value else None
 
 
 def parse_latitude(latitude: str, direction: str) -> Optional[float]:
@@ -152,14 +213,11 @@ def parse_latitude(latitude: str, direction: str) -> Optional[float]:
     """
     if not latitude and not direction:
         return None
-    degrees = parse_degrees(latitude)
-    direction = direction.upper()
-    if direction == 'N':
-        return degrees
-    elif direction == 'S':
-        return -degrees
-    else:
-        raise ValueError(f"Latitude has bad direction: {direction!r}")
+    try:
+        sign = _LATITUDE_SIGNS[direction]
+    except KeyError:
+        raise ValueError(f"Latitude has bad direction: {direction!r}") from None
+    return sign * parse_degrees(latitude)
 
 
 def parse_longitude(longitude: str, direction: str) -> Optional[float]:
@@ -175,14 +233,41 @@ def parse_longitude(longitude: str, direction: str) -> Optional[float]:
     """
     if not longitude and not direction:
         return None
-    degrees = parse_degrees(longitude)
-    direction = direction.upper()
-    if direction == 'E':
-        return degrees
-    elif direction == 'W':
-        return -degrees
-    else:
-        raise ValueError(f"Longitude has bad direction: {direction!r}")
+    try:
+        sign = _LONGITUDE_SIGNS[direction]
+    except KeyError:
+        raise ValueError(f"Longitude has bad direction: {direction!r}") from None
+    return sign * parse_degrees(longitude)
+
+
+def parse_many(lines: Iterable[str]) -> Iterator[sentences.Sentence]:
+    """
+    Lazily parse many sentences, eg. the lines of a log file.
+
+    Raises:
+        ValueError:
+            As per `parse()`, when the bad line is reached.
+
+    Returns:
+        Iterator over parsed sentences, in the same order as the given lines.
+    """
+    return map(parse, lines)
+
+
+def parse_many_skip_errors(lines: Iterable[str]) -> Iterator[sentences.Sentence]:
+    """
+    Lazily parse many sentences, silently skipping any that cannot be parsed.
+
+    Useful for noisy sources like serial ports, where unknown, garbled, or
+    truncated sentences are to be expected.
+
+    Returns:
+        Iterator over the sentences that could be parsed.
+    """
+    for line in lines:
+        data = parse(line, strict=False)
+        if data is not None:
+            yield data
 
 
 def parse_speed(value: str) -> Optional[float]:
@@ -204,6 +289,7 @@ def parse_speed(value: str) -> Optional[float]:
     return round(ms, 6)
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_time(value: str) -> Optional[datetime.time]:
     """
     Parse time in HHMMSS.SSS format.
@@ -217,7 +303,12 @@ def parse_time(value: str) -> Optional[datetime.time]:
     hours = int(value[:2])
     minutes = int(value[2:4])
     seconds = int(value[4:6])
-    microseconds = int(f"{value[7:]:0<6}")
+
+    # Scale fractional digits up to microseconds, eg. '487' to 487000
+    fraction = value[7:]
+    if len(fraction) > 6:
+        raise ValueError(f"NMEA time string has too many fractional digits: {value!r}")
+    microseconds = int(fraction) * _POWERS_OF_TEN[6 - len(fraction)] if fraction else 0
     return datetime.time(hours, minutes, seconds, microseconds)
 
 
@@ -3,34 +3,47 @@ Provides a Python dataclass subclass for every NMEA sentence of interest.
 """
 from __future__ import annotations      # Allow forward references for return types
 
+from array import array
 import dataclasses
 from dataclasses import dataclass
 import datetime
 import json
-from typing import List, Optional
+import math
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from . import parser
 
 
-@dataclass
+_UTC = datetime.timezone.utc
+
+
+@dataclass(slots=True)
 class Satellite:
     """
     Satellite metadata (from GSV message).
     """
     id_number: int                      # ID number of this satellite
-    elevation: float                    # Satellite elevation (-90 to 90 degrees)
-    azimuth: float                      # Azimuth to true north (0 to 359 degrees)
+    elevation: Optional[float]          # Satellite elevation (-90 to 90 degrees)
+    azimuth: Optional[float]            # Azimuth to true north (0 to 359 degrees)
     snr: Optional[float]                # Signal-to-noise ratio (dB)
 
     @classmethod
     def from_fields(cls, fields: List[str]) -> Satellite:
         return cls(
             id_number=int(fields[0]),
-            elevation=float(fields[1]),
-            azimuth=float(fields[2]),
+            elevation=parser.parse_float(fields[1]),
+            azimuth=parser.parse_float(fields[2]),
             snr=parser.parse_float(fields[3]),
         )
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'id_number': self.id_number,
+            'elevation': self.elevation,
+            'azimuth': self.azimuth,
+            'snr': self.snr,
+        }
+
 
 class Sentence:
     """
@@ -39,29 +52,69 @@ class Sentence:
     A one-to-one relationship exists between a line of text and its matching
     dataclass object.  Compound messages (like GSV) can be combined at a higher
     level of code.
+
+    The `from_fields()` constructors check the address field against `_CODE`
+    only when assertions are enabled, as `parser.parse()` has already chosen
+    the class from that same field.
     """
+    # Empty, so that slotted dataclass subclasses don't get a `__dict__`
+    __slots__ = ()
+
+    # Sentence code following the two-letter talker ID, eg. 'GGA' in '$GPGGA'
+    _CODE: ClassVar[str]
+
     @classmethod
     def from_fields(cls, fields: List[str]) -> Sentence:
         raise NotImplementedError()
 
-    def to_json(self) -> str:
-        raw = dataclasses.asdict(self)
-        raw['_type'] = self.__class__.__name__
-        data = {}
-        for key, value in raw.items():
-            if isinstance(value, datetime.date):
-                value = value.isoformat()
-            elif isinstance(value, datetime.time):
-                value = value.isoformat()
-            data[key] = value
-        return json.dumps(data, sort_keys=True, indent=4)
+    @classmethod
+    def _check_address(cls, address: str) -> None:
+        """
+        Raise `ValueError` if address field is not for this type of sentence.
+        """
+        if sentence_code(address) != cls._CODE:
+            raise ValueError(f"$Gx{cls._CODE} not in first field, found: {address!r}")
+
+    def to_json(self, pretty: bool = True) -> str:
+        """
+        Serialise sentence to JSON.
+
+        Args:
+            pretty:
+                Indent output for people to read. Set to False for compact
+                output, which is much faster to produce.
+        """
+        encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+        return encoder.encode(self._json_data())
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Compact JSON as UTF-8 bytes, ready to write to a binary stream.
+        """
+        return self.to_json(pretty=False).encode()
+
+    def _json_data(self) -> Dict[str, Any]:
+        data = self._to_dict()
+        data['_type'] = self.__class__.__name__
+        return data
+
+    def _to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow version of `dataclasses.asdict()`, without the recursive deep-copy.
+
+        Subclasses override this with a literal dictionary of their fields,
+        which is much faster than looking up each field by name.
+        """
+        return {name: getattr(self, name) for name in _field_names(type(self))}
 
 
-@dataclass
+@dataclass(slots=True)
 class GGA(Sentence):
     """
     Fix information.
     """
+    _CODE: ClassVar[str] = 'GGA'
+
     time: Optional[datetime.time]
     latitude: Optional[float]
     longitude: Optional[float]
@@ -75,8 +128,8 @@ class GGA(Sentence):
 
     @classmethod
     def from_fields(cls, fields: List[str]) -> GGA:
-        if 'GGA' not in fields[0]:
-            raise ValueError(f"$GxGGA not in first field, found: {fields[0]!r}")
+        if __debug__:
+            cls._check_address(fields[0])
 
         return cls(
             time=parser.parse_time(fields[1]),
@@ -91,12 +144,28 @@ class GGA(Sentence):
             differential_reference=fields[14],
         )
 
-
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'time': self.time,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'position_fix': self.position_fix,
+            'satellites_used': self.satellites_used,
+            'hdop': self.hdop,
+            'altitude_msl': self.altitude_msl,
+            'altitude_hae': self.altitude_hae,
+            'differential_age': self.differential_age,
+            'differential_reference': self.differential_reference,
+        }
+
+
+@dataclass(slots=True)
 class GSA(Sentence):
     """
     Dilution of precision (DOP), and active satellites.
     """
+    _CODE: ClassVar[str] = 'GSA'
+
     mode: str                           # Manual 'M' or automatic 'A'
     fix: int                            # 1: not available, 2: 2D, 3: 3D
     ids: List[int]                      # IDs (1-32: GPS, 33-64: SBAS, 64+: GLONASS)
@@ -106,8 +175,8 @@ class GSA(Sentence):
 
     @classmethod
     def from_fields(cls,  fields: List[str]) -> GSA:
-        if 'GSA' not in fields[0]:
-            raise ValueError(f"$GxGSA not in first field, found: {fields[0]!r}")
+        if __debug__:
+            cls._check_address(fields[0])
 
         ids = [int(n) for n in fields[3:-3] if n]
         return cls(
@@ -119,12 +188,24 @@ class GSA(Sentence):
             vdop=parser.parse_float(fields[-1]),
         )
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'mode': self.mode,
+            'fix': self.fix,
+            'ids': self.ids,
+            'pdop': self.pdop,
+            'hdop': self.hdop,
+            'vdop': self.vdop,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class GSV(Sentence):
     """
     Satellites in view.
     """
+    _CODE: ClassVar[str] = 'GSV'
+
     messages_total: int                 # How many GSV messages total
     message_number: int                 # Index of this message (1-based)
     satellites_total: int               # Total number of satellites in view
@@ -132,41 +213,78 @@ class GSV(Sentence):
 
     @classmethod
     def from_fields(cls,  fields: List[str]) -> GSV:
-        if 'GSV' not in fields[0]:
-            raise ValueError(f"$GxGSV not in first field, found: {fields[0]!r}")
+        if __debug__:
+            cls._check_address(fields[0])
 
-        # Message
-        messages_total = int(fields[1])
-        message_number = int(fields[2])
-        satellites_total = int(fields[3])
-        remaining_fields = fields[4:]
+        if len(fields) < 4:
+            raise ValueError(f"Too few message fields in GSV sentence, found: {fields}")
 
-        # Satellites
-        satellites = []
+        # Satellites, four fields each after the message fields
         NUM_FIELDS = 4
-        for i in range(0, len(remaining_fields), NUM_FIELDS):
-            satellite_fields = remaining_fields[i:i+NUM_FIELDS]
-            if len(satellite_fields) != NUM_FIELDS:
-                raise ValueError(
-                    f"Wrong number of satellite fields in sentence. {NUM_FIELDS} fields "
-                    f"expected, found: {satellite_fields}"
-                )
-            satellite = Satellite.from_fields(satellite_fields)
-            satellites.append(satellite)
+        extra = (len(fields) - 4) % NUM_FIELDS
+        if extra:
+            raise ValueError(
+                f"Wrong number of satellite fields in sentence. {NUM_FIELDS} fields "
+                f"expected, found: {fields[-extra:]}"
+            )
+        parse_float = parser.parse_float
+        satellites = [
+            Satellite(
+                int(fields[i]),
+                parse_float(fields[i + 1]),
+                parse_float(fields[i + 2]),
+                parse_float(fields[i + 3]),
+            )
+            for i in range(4, len(fields), NUM_FIELDS)
+        ]
 
         return cls(
-            messages_total=messages_total,
-            message_number=message_number,
-            satellites_total=satellites_total,
+            messages_total=int(fields[1]),
+            message_number=int(fields[2]),
+            satellites_total=int(fields[3]),
             satellites=satellites,
         )
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'messages_total': self.messages_total,
+            'message_number': self.message_number,
+            'satellites_total': self.satellites_total,
+            'satellites': self.satellites,
+        }
+
+    @property
+    def satellites_soa(self) -> Dict[str, array[Any]]:
+        """
+        Satellite data as one typed array per field, rather than a list of objects.
+
+        The arrays are contiguous in memory, which suits bulk statistics, and
+        support the buffer protocol, eg. for `numpy.frombuffer()`.
 
-@dataclass
+        Returns:
+            Dictionary of arrays keyed by `Satellite` field name. Identity
+            numbers are 16-bit integers, the rest are 32-bit floats using NaN
+            for missing values.
+        """
+        def floats(values: List[Optional[float]]) -> array[float]:
+            return array('f', [math.nan if value is None else value for value in values])
+
+        satellites = self.satellites
+        return {
+            'id_number': array('h', [satellite.id_number for satellite in satellites]),
+            'elevation': floats([satellite.elevation for satellite in satellites]),
+            'azimuth': floats([satellite.azimuth for satellite in satellites]),
+            'snr': floats([satellite.snr for satellite in satellites]),
+        }
+
+
+@dataclass(slots=True)
 class RMC(Sentence):
     """
     Recommended minimum data.
     """
+    _CODE: ClassVar[str] = 'RMC'
+
     time: Optional[datetime.time]
     status: str
     latitude: Optional[float]
@@ -178,8 +296,8 @@ class RMC(Sentence):
 
     @classmethod
     def from_fields(cls, fields: List[str]) -> RMC:
-        if 'RMC' not in fields[0]:
-            raise ValueError(f"$GxRMC not in first field, found: {fields[0]!r}")
+        if __debug__:
+            cls._check_address(fields[0])
         return cls(
             time=parser.parse_time(fields[1]),
             status=fields[2],
@@ -191,6 +309,18 @@ class RMC(Sentence):
             declination=parser.parse_declination(fields[10], fields[11]),
         )
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'time': self.time,
+            'status': self.status,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'speed': self.speed,
+            'course': self.course,
+            'date': self.date,
+            'declination': self.declination,
+        }
+
     @property
     def speed_kph(self) -> Optional[float]:
         """
@@ -210,25 +340,16 @@ class RMC(Sentence):
         """
         if (self.date is None) or (self.time is None):
             return None
+        return datetime.datetime.combine(self.date, self.time, tzinfo=_UTC)
 
-        date = datetime.datetime(
-            year=self.date.year,
-            month=self.date.month,
-            day=self.date.day,
-            hour=self.time.hour,
-            minute=self.time.minute,
-            second=self.time.second,
-            microsecond=self.time.microsecond,
-            tzinfo=datetime.timezone.utc,
-        )
-        return date
 
-
-@dataclass
+@dataclass(slots=True)
 class TXT(Sentence):
     """
     Text transmission
     """
+    _CODE: ClassVar[str] = 'TXT'
+
     sentence_id: int
     sentence_number: int
     sentences_total: int
@@ -236,12 +357,69 @@ class TXT(Sentence):
 
     @classmethod
     def from_fields(cls, fields: List[str]) -> TXT:
-        if 'TXT' not in fields[0]:
-            raise ValueError(f"$GxTXT not in first field, found: {fields[0]!r}")
+        if __debug__:
+            cls._check_address(fields[0])
+
+        if len(fields) < 5:
+            raise ValueError(f"Too few fields in TXT sentence, found: {fields}")
 
         return cls(
             sentence_id=int(fields[1]),
             sentence_number=int(fields[2]),
             sentences_total=int(fields[3]),
-            message=fields[4],
+            message=','.join(fields[4:]),  # Message text may itself contain commas
         )
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'sentence_id': self.sentence_id,
+            'sentence_number': self.sentence_number,
+            'sentences_total': self.sentences_total,
+            'message': self.message,
+        }
+
+
+def sentence_code(address: str) -> str:
+    """
+    Find sentence code from the address field, eg. 'GGA' from '$GPGGA'.
+
+    Proprietary sentences (eg. Garmin's '$PGRMC') and longer addresses have
+    no code, even if their last three letters match a known one.
+
+    Returns:
+        Three-letter sentence code, or an empty string if not a standard address.
+    """
+    if len(address) != 6 or address[:1] != '$' or address[1:2] == 'P':
+        return ''
+    return address[3:]
+
+
+# Field names of each dataclass, filled in by `_field_names()`
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Names of the fields of the given dataclass, looked up once per class.
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(field.name for field in dataclasses.fields(cls))
+    return names
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert values that the `json` module does not know how to serialise.
+    """
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Satellite):
+        return value._to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Reuse encoders, rather than have `json.dumps()` build a new one every call
+_COMPACT_ENCODER = json.JSONEncoder(
+    default=_json_default, separators=(',', ':'), sort_keys=True)
+_PRETTY_ENCODER = json.JSONEncoder(default=_json_default, indent=4, sort_keys=True)
@@ -1,10 +1,7 @@
 
-import bz2
 from contextlib import contextmanager
-import gzip
-import lzma
 from pathlib import Path
-from typing import Iterator, IO
+from typing import Any, Callable, Dict, Iterator, IO, Optional, cast
 
 
 @contextmanager
@@ -14,13 +11,16 @@ def magic_open(
     encoding: str = 'utf-8',
     errors: str = 'strict',
     newline: Optional[str] = None,
-) -> Iterator[IO[str]]:
+) -> Iterator[IO[Any]]:
     """
     Open plain or compressed files transparently as context manager.
 
     Recognises BZ2, GZ, and XZ compressed files. Falls back
     to uncompressed opening if file extension not recognised.
 
+    The text-mode arguments `encoding`, `errors`, and `newline` are ignored
+    if a binary `mode` is given.
+
     For example::
 
         >>> with magic_open(path) as fp:
@@ -31,23 +31,35 @@ def magic_open(
         mode: File open mode.
         encoding: Text file encoding.
         errors: How encoding errors should be handled.
+        newline: How line endings should be handled.
 
     Return:
         A file handle
     """
-    # Pick a open function
+    # Pick a open function, only importing the compression module needed
     path = Path(path)
     extension = path.suffix.lower()
-    open_functions = {
-        '.bz2': bz2.open,
-        '.gz': gzip.open,
-        '.xz': lzma.open,
-    }
-    open_function = open_functions.get(extension, open)
+    open_function: Callable[..., IO[Any]]
+    if extension == '.bz2':
+        import bz2
+        open_function = bz2.open
+    elif extension == '.gz':
+        import gzip
+        open_function = gzip.open
+    elif extension == '.xz':
+        import lzma
+        open_function = lzma.open
+    else:
+        open_function = open
+
+    # Binary streams do not accept text-mode arguments
+    kwargs: Dict[str, Any] = {}
+    if 'b' not in mode:
+        kwargs = {'encoding': encoding, 'errors': errors, 'newline': newline}
 
     # Context manager
+    fp = cast(IO[Any], open_function(path, mode, **kwargs))
     try:
-        fp = open_function(path, mode, encoding=encoding, errors=errors, newline=newline)
         yield fp
     finally:
         fp.close()
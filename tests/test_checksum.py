@@ -18,6 +18,11 @@ class ChecksumAddTest(TestCase):
         sentence2 = checksum.add(sentence)
         self.assertEqual(sentence2, "$GPVTG,2.95,T,,M,16.1,N,29.8,K*5B")
 
+    def test_round_trip_leading_zero(self) -> None:
+        sentence = checksum.add("$GPGLL,3554.923,N")
+        self.assertEqual(sentence, "$GPGLL,3554.923,N*0F")
+        self.assertTrue(checksum.verify(sentence))
+
 
 class ChecksumCalculateTest(TestCase):
     def test_checksum_calculate(self) -> None:
@@ -39,6 +44,14 @@ class ChecksumVerifyTest(TestCase):
         sentence = '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,*59'
         self.assertTrue(checksum.verify(sentence))
 
+    def test_valid_returns_index(self) -> None:
+        sentence = ' $GPGLL,3554.923,N*0F\r\n'
+        self.assertEqual(checksum.verify(sentence), 17)
+
+    def test_valid_leading_zero(self) -> None:
+        sentence = '$GPGLL,3554.923,N*0F'
+        self.assertTrue(checksum.verify(sentence))
+
     def test_invalid(self) -> None:
         sentence = '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,*FF'
         with self.assertRaises(ValueError) as cm:
@@ -47,6 +60,18 @@ class ChecksumVerifyTest(TestCase):
         message = "Checksum in sentence does not match that calculated: 0xFF != 0x59"
         self.assertEqual(str(cm.exception), message)
 
+    def test_malformed(self) -> None:
+        # Checksum is 0x78, but must be given as exactly two hex digits
+        tails = ('0x78', ' 78', '+78', '7_8', '000078', '078')
+        for tail in tails:
+            with self.subTest(tail=tail):
+                with self.assertRaises(ValueError):
+                    checksum.verify('$GPGLL,3554.923,N,08202.503,W*' + tail)
+
+    def test_malformed_missing_leading_zero(self) -> None:
+        with self.assertRaises(ValueError):
+            checksum.verify('$GPGLL,3554.923,N*F')
+
     def test_missing(self) -> None:
         sentence = '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,'
         with self.assertRaises(ValueError) as cm:
@@ -57,3 +82,13 @@ class ChecksumVerifyTest(TestCase):
             "'$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,'"
         )
         self.assertEqual(str(cm.exception), message)
+
+
+class ChecksumVerifyManyTest(TestCase):
+    def test_verify_many(self) -> None:
+        sentences = [
+            '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,*59',
+            '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,*FF',
+            '$GPGGA,055044.591,3554.916,N,08202.532,W,0,00,,,M,,M,,',
+        ]
+        self.assertEqual(checksum.verify_many(sentences), [True, False, False])
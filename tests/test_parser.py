@@ -1,8 +1,14 @@
 
 import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Set
 from unittest import TestCase
 
-from nmea import parser, sentences
+from nmea import parser, sentences, utils
+
+
+DATA_FOLDER = Path(__file__).parent / 'data'
 
 
 class ParseTest(TestCase):
@@ -24,12 +30,79 @@ class ParseTest(TestCase):
             self.assertIsInstance(data, sentences.Sentence)
             self.assertEqual(type_string, data.__class__.__name__)
 
+    def test_parse_any_talker(self) -> None:
+        data = parser.parse("$GAGSV,1,1,02,05,45,120,31,09,12,300,*66")
+        self.assertIsInstance(data, sentences.GSV)
+        data = parser.parse("$GLGSA,A,3,82,80,73,,,,,,,,,,1.48,0.81,1.24*1B")
+        self.assertIsInstance(data, sentences.GSA)
+
+    def test_parse_surrounding_whitespace(self) -> None:
+        data = parser.parse(f"  {self.sentences['TXT']}\r\n")
+        self.assertIsInstance(data, sentences.TXT)
+        assert isinstance(data, sentences.TXT)
+        self.assertEqual(data.message, 'ROM CORE 3.01 (107888)')
+
     def test_unknown_sentence_type(self) -> None:
         line = "$GNGXG,01,01,02,ROM CORE 3.01 (107888)*2B"
         message = r"Unknown NMEA sentence: '\$GNGXG'"
         with self.assertRaisesRegex(parser.UnknownSentence, message):
             parser.parse(line)
 
+    def test_proprietary_sentence(self) -> None:
+        # Garmin sentence, which ends with a known code
+        line = "$PGRMC,A,218.8,100,,,,,,A,3,1,2,4,30*72"
+        message = r"Unknown NMEA sentence: '\$PGRMC'"
+        with self.assertRaisesRegex(parser.UnknownSentence, message):
+            parser.parse(line)
+
+    def test_address_too_long(self) -> None:
+        line = "$GPGGAX,031921.542,3653.0286,S,17441.8568,E,0,00,,-26.2,M,26.2,M,,0000*FF"
+        message = r"Unknown NMEA sentence: '\$GPGGAX'"
+        with self.assertRaisesRegex(parser.UnknownSentence, message):
+            parser.parse(line)
+
+    def test_parse_not_strict(self) -> None:
+        data = parser.parse(self.sentences['TXT'], strict=False)
+        self.assertIsInstance(data, sentences.TXT)
+
+        # Unknown sentence, bad checksum, and too few fields
+        lines = (
+            "$GNGXG,01,01,02,ROM CORE 3.01 (107888)*2B",
+            "$GNTXT,01,01,02,ROM CORE 3.01 (107888)*FF",
+            "$GNTXT,01*7C",
+        )
+        for line in lines:
+            self.assertIs(parser.parse(line, strict=False), None)
+
+    def test_unknown_sentence_bad_checksum(self) -> None:
+        # Unknown sentences are rejected before their checksum is checked
+        line = "$GPZDA,050306.00,10,04,2022,00,00*FF"
+        with self.assertRaises(parser.UnknownSentence):
+            parser.parse(line)
+
+
+class ParseManyTest(TestCase):
+    lines = [
+        "$GNTXT,01,01,02,ROM CORE 3.01 (107888)*2B",
+        "$GNGXG,01,01,02,ROM CORE 3.01 (107888)*2B",
+        "$GNGGA,031921.542,3653.0286,S,17441.8568,E,0,00,,-26.2,M,26.2,M,,0000*FF",
+        "$GNGSA,A,3,19,14,02,20,06,03,24,12,17,,,,1.48,0.81,1.24*14",
+    ]
+
+    def test_parse_many(self) -> None:
+        parsed = parser.parse_many(self.lines[:1])
+        self.assertIsInstance(next(parsed), sentences.TXT)
+
+        # Errors raised when reached
+        parsed = parser.parse_many(self.lines)
+        next(parsed)
+        with self.assertRaises(parser.UnknownSentence):
+            next(parsed)
+
+    def test_parse_many_skip_errors(self) -> None:
+        parsed = list(parser.parse_many_skip_errors(self.lines))
+        self.assertEqual([type(data) for data in parsed], [sentences.TXT, sentences.GSA])
+
 
 class ParseAltitudeTest(TestCase):
     def test_valid_altitude(self) -> None:
@@ -143,6 +216,38 @@ class ParseDegreesTest(TestCase):
         with self.assertRaisesRegex(ValueError, message):
             parser.parse_degrees('')
 
+    def test_invalid(self) -> None:
+        for value in ('nan', 'inf', '1e3', '35_53.5', '-3650.4', '36.50.4', ' 3650.4'):
+            with self.subTest(value=value):
+                message = r"Cannot parse degrees, invalid value given: "
+                with self.assertRaisesRegex(ValueError, message):
+                    parser.parse_degrees(value)
+
+    def test_corpus(self) -> None:
+        """
+        Compare against exact decimal arithmetic for every coordinate in test data.
+        """
+        for value in self.corpus_coordinates():
+            with self.subTest(value=value):
+                integer, _, _ = value.partition('.')
+                minutes = Decimal(value) - Decimal(integer[:-2] or 0) * 100
+                expected = int(integer[:-2] or 0) + minutes / 60
+                degrees = parser.parse_degrees(value)
+                self.assertAlmostEqual(degrees, float(expected), delta=1e-6)
+
+    def corpus_coordinates(self) -> Set[str]:
+        coordinates: Set[str] = set()
+        for path in DATA_FOLDER.iterdir():
+            with utils.magic_open(path) as fp:
+                for line in fp:
+                    fields = parser.sentence_split(line.strip())
+                    if fields[0][3:] == 'GGA':
+                        coordinates.update((fields[2], fields[4]))
+                    elif fields[0][3:] == 'RMC':
+                        coordinates.update((fields[3], fields[5]))
+        coordinates.discard('')
+        return coordinates
+
 
 class ParseFloatTest(TestCase):
     def test_parse_float(self) -> None:
@@ -213,6 +318,17 @@ class ParseTimeTest(TestCase):
         time = parser.parse_time('161229')
         self.assertEqual(time, datetime.time(16, 12, 29, 0))
 
+    def test_parse_time_fractions(self) -> None:
+        self.assertEqual(parser.parse_time('161229.4'), datetime.time(16, 12, 29, 400000))
+        self.assertEqual(parser.parse_time('161229.48'), datetime.time(16, 12, 29, 480000))
+        self.assertEqual(
+            parser.parse_time('161229.487654'), datetime.time(16, 12, 29, 487654))
+
+    def test_parse_time_too_many_fractional_digits(self) -> None:
+        message = "NMEA time string has too many fractional digits: '161229.4876543'"
+        with self.assertRaisesRegex(ValueError, message):
+            parser.parse_time('161229.4876543')
+
     def test_parse_time_too_short(self) -> None:
         message = "NMEA time string must be at least 6-characters long"
         with self.assertRaisesRegex(ValueError, message):
@@ -222,6 +338,13 @@ class ParseTimeTest(TestCase):
         time = parser.parse_time('')
         self.assertIs(time, None)
 
+    def test_parse_time_cached(self) -> None:
+        parser.parse_time.cache_clear()
+        first = parser.parse_time('161229.487')
+        second = parser.parse_time('161229.487')
+        self.assertIs(first, second)
+        self.assertEqual(parser.parse_time.cache_info().hits, 1)
+
 
 class SentenceSplitTest(TestCase):
     def test_sentence_split(self) -> None:
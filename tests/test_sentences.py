@@ -1,9 +1,10 @@
 
 import dataclasses
 import datetime
+import math
 import textwrap
 from typing import List
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
 from nmea import sentences
 from nmea import parser
@@ -14,6 +15,53 @@ class TestBaseSentence(TestCase):
         with self.assertRaises(NotImplementedError):
             sentences.Sentence.from_fields([])
 
+    def test_sentence_code(self) -> None:
+        self.assertEqual(sentences.sentence_code('$GPGGA'), 'GGA')
+        self.assertEqual(sentences.sentence_code('$GLGSV'), 'GSV')
+        for address in ('$PGRMC', '$GPGGAX', 'GPGGA', '$GGA', ''):
+            with self.subTest(address=address):
+                self.assertEqual(sentences.sentence_code(address), '')
+
+    def test_to_dict(self) -> None:
+        """
+        Hand-written `_to_dict()` methods must match the dataclass fields.
+        """
+        lines = (
+            "$GNGGA,031921.542,3653.0286,S,17441.8568,E,0,00,,-26.2,M,26.2,M,,0000*6D",
+            "$GNGSA,A,3,19,14,02,20,06,03,24,12,17,,,,1.48,0.81,1.24*14",
+            "$GPGSV,3,1,10,26,66,061,,03,58,266,,22,52,324,,16,49,014,*78",
+            "$GPRMC,010432.00,A,3653.0835,S,17441.9076,E,26.99784,240.241,240521,19.9,E*4C",
+            "$GNTXT,01,01,02,ROM CORE 3.01 (107888)*2B",
+        )
+        for line in lines:
+            data = parser.parse(line)
+            with self.subTest(type=type(data).__name__):
+                assert dataclasses.is_dataclass(data)
+                expected = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+                self.assertEqual(data._to_dict(), expected)
+
+        satellite = sentences.Satellite(id_number=3, elevation=58.0, azimuth=266.0, snr=None)
+        expected = dataclasses.asdict(satellite)
+        self.assertEqual(satellite._to_dict(), expected)
+
+    def test_to_dict_fallback(self) -> None:
+        """
+        Subclasses without their own `_to_dict()` still serialise every field.
+        """
+        @dataclasses.dataclass(slots=True)
+        class ZDA(sentences.Sentence):
+            time: datetime.time
+            day: int
+
+        data = ZDA(time=datetime.time(5, 3, 6), day=10)
+        self.assertEqual(data._to_dict(), {'time': datetime.time(5, 3, 6), 'day': 10})
+        self.assertEqual(data.to_json(pretty=False), '{"_type":"ZDA","day":10,"time":"05:03:06"}')
+
+    def test_slots(self) -> None:
+        line = "$GNTXT,01,01,02,ROM CORE 3.01 (107888)*2B"
+        data = parser.parse(line)
+        self.assertFalse(hasattr(data, '__dict__'))
+
 
 class TestGGA(TestCase):
     """
@@ -42,6 +90,7 @@ class TestGGA(TestCase):
         data = parser.parse(s)
         self.assertEqual(dataclasses.asdict(data), self.expected)
 
+    @skipUnless(__debug__, "Address is only checked when assertions are enabled")
     def test_wrong_sentence_type(self) -> None:
         fields = parser.sentence_split(
             '$GPGSA,A,3,10,12,21,23,25,31,32,,,,,,1.6,0.9,1.3*3A'
@@ -80,6 +129,7 @@ class TestGSA(TestCase):
         self.assertAlmostEqual(data.hdop, 0.81)
         self.assertAlmostEqual(data.vdop, 1.24)
 
+    @skipUnless(__debug__, "Address is only checked when assertions are enabled")
     def test_wrong_sentence_type(self) -> None:
         fields = parser.sentence_split("$GPGSV,3,3,10,01,05,306,,29,05,123,*77")
         with self.assertRaises(ValueError) as cm:
@@ -115,6 +165,26 @@ class TestGSV(TestCase):
             sentences.Satellite(id_number=16, elevation=49.0, azimuth=14.0, snr=None),
         ])
 
+    def test_satellites_soa(self) -> None:
+        data = parser.parse(self.group[1])
+        assert isinstance(data, sentences.GSV)
+        soa = data.satellites_soa
+        self.assertEqual(list(soa['id_number']), [31, 4, 32, 9])
+        self.assertEqual(list(soa['elevation']), [46.0, 38.0, 10.0, 6.0])
+        self.assertEqual(list(soa['azimuth']), [134.0, 229.0, 69.0, 238.0])
+        snr = list(soa['snr'])
+        self.assertEqual(snr[2], 24.0)
+        self.assertTrue(all(math.isnan(value) for value in snr[:2] + snr[3:]))
+
+    def test_satellite_position_unknown(self) -> None:
+        line = "$GPGSV,3,3,12,20,16,358,22,24,28,276,14,25,00,223,,28,,,28*4F"
+        data = parser.parse(line)
+        assert isinstance(data, sentences.GSV)
+        self.assertEqual(
+            data.satellites[-1],
+            sentences.Satellite(id_number=28, elevation=None, azimuth=None, snr=28.0),
+        )
+
     def test_wrong_number_satellite_fields(self) -> None:
         line = "$GPGSV,3,3,10,01,05,306,,29,05,*77"
         fields = parser.sentence_split(line)
@@ -124,6 +194,13 @@ class TestGSV(TestCase):
         with self.assertRaisesRegex(ValueError, message):
             sentences.GSV.from_fields(fields)
 
+    def test_too_few_message_fields(self) -> None:
+        fields = ['$GPGSV', '1', '1']
+        message = r"Too few message fields in GSV sentence, found: \['\$GPGSV', '1', '1'\]"
+        with self.assertRaisesRegex(ValueError, message):
+            sentences.GSV.from_fields(fields)
+
+    @skipUnless(__debug__, "Address is only checked when assertions are enabled")
     def test_wrong_sentence_type(self) -> None:
         fields = parser.sentence_split(
             '$GPGSA,A,3,10,12,21,23,25,31,32,,,,,,1.6,0.9,1.3*3A'
@@ -204,6 +281,22 @@ class TestRMC(TestCase):
         """).strip()
         self.assertEqual(string, expected)
 
+    def test_to_json_compact(self) -> None:
+        data = parser.parse(self.line)
+        string = data.to_json(pretty=False)
+        self.assertNotIn('\n', string)
+        self.assertEqual(string.encode(), data.to_json_bytes())
+
+    def test_to_json_bytes(self) -> None:
+        data = parser.parse(self.line)
+        expected = (
+            b'{"_type":"RMC","course":240.241,"date":"2021-05-24","declination":19.9,'
+            b'"latitude":-36.884725,"longitude":174.69846,"speed":13.888889,'
+            b'"status":"A","time":"01:04:32"}'
+        )
+        self.assertEqual(data.to_json_bytes(), expected)
+
+    @skipUnless(__debug__, "Address is only checked when assertions are enabled")
     def test_wrong_setence_type(self) -> None:
         fields = parser.sentence_split(
             '$GPGSA,A,3,10,12,21,23,25,31,32,,,,,,1.6,0.9,1.3*3A'
@@ -227,6 +320,18 @@ class TestTXT(TestCase):
         self.assertEqual(data.sentences_total, 2)
         self.assertEqual(data.message, "ROM CORE 3.01 (107888)")
 
+    def test_parse_txt_commas(self) -> None:
+        data = parser.parse("$GNTXT,01,01,02,PF=3FF,ANT=OK*05")
+        assert isinstance(data, sentences.TXT)
+        self.assertEqual(data.message, "PF=3FF,ANT=OK")
+
+    def test_too_few_fields(self) -> None:
+        fields = parser.sentence_split("$GNTXT,01,01,02*7F")
+        message = r"Too few fields in TXT sentence, found: \['\$GNTXT', '01', '01', '02'\]"
+        with self.assertRaisesRegex(ValueError, message):
+            sentences.TXT.from_fields(fields)
+
+    @skipUnless(__debug__, "Address is only checked when assertions are enabled")
     def test_wrong_sentence_type(self) -> None:
         fields = parser.sentence_split(
             '$GPGSA,A,3,10,12,21,23,25,31,32,,,,,,1.6,0.9,1.3*3A'